@@ -1,50 +1,180 @@
 import machine
 import time
 import math
-import json
+import micropython
+from array import array
 
 # Display resolution (from original driver)
 EPD_WIDTH = 122
 EPD_HEIGHT = 250
 
+# Pixel bit masks indexed by x & 7 (highest order bit is on the left)
+_BITS = b'\x80\x40\x20\x10\x08\x04\x02\x01'
+_NBITS = bytes(b ^ 0xff for b in _BITS)
+
+def flatten_polygon(polygon):
+    """Return the polygon as a flat array('h') of alternating x, y coordinates."""
+    if isinstance(polygon, array):
+        return polygon
+    return array('h', [int(v) for point in polygon for v in point])
+
+@micropython.native
+def _round10(v):
+    # Round a x1024 fixed-point value to an integer, ties to even like round().
+    # Adding the low bit of the integer part turns the 512 tie into a carry
+    # only for odd results, so no branch is needed.
+    return (v + 511 + ((v >> 10) & 1)) >> 10
+
+@micropython.native
 def scale_polygon(polygon, scale):
+    polygon = flatten_polygon(polygon)
     if scale == 1:
         return polygon
-    return [[int(round(x * scale)), int(round(y * scale))] for x, y in polygon]
+    # x1024 fixed point
+    s = int(round(scale * 1024))
+    return array('h', [_round10(v * s) for v in polygon])
 
+@micropython.native
 def move_polygon(polygon, delta_x, delta_y):
-    return [[int(x + delta_x), int(y + delta_y)] for x, y in polygon]
-
+    polygon = flatten_polygon(polygon)
+    moved = array('h', polygon)
+    for i in range(0, len(moved), 2):
+        moved[i] = int(moved[i] + delta_x)
+        moved[i + 1] = int(moved[i + 1] + delta_y)
+    return moved
+
+@micropython.native
 def rotate_polygon(polygon, angle):
     """Rotate the polygon by a given angle in degrees clockwise."""
+    polygon = flatten_polygon(polygon)
     if angle == 0:
         return polygon
     rad = math.radians(angle)
-    cos_theta = math.cos(rad)
-    sin_theta = math.sin(rad)
+    # Rotation matrix in x1024 fixed point, so the vertex loop is integer only
+    c = int(round(math.cos(rad) * 1024))
+    s = int(round(math.sin(rad) * 1024))
     
-    rotated = []
-    for x, y in polygon:
-        # Apply the rotation matrix:
-        x_new = x * cos_theta - y * sin_theta
-        y_new = x * sin_theta + y * cos_theta
-        rotated.append([int(round(x_new)), int(round(y_new))])
+    rotated = array('h', polygon)
+    for i in range(0, len(rotated), 2):
+        x = rotated[i]
+        y = rotated[i + 1]
+        rotated[i] = _round10(x * c - y * s)
+        rotated[i + 1] = _round10(x * s + y * c)
     
     return rotated
 
+@micropython.viper
+def _clear_viper(buf, n: int, c: int):
+    # Fill whole 32-bit words first, then the remaining tail bytes
+    p = ptr32(buf)
+    w = int((c & 0xff) * 0x01010101)
+    nw = n >> 2
+    i = 0
+    while i < nw:
+        p[i] = w
+        i += 1
+    b = ptr8(buf)
+    i = nw << 2
+    while i < n:
+        b[i] = c
+        i += 1
+
+@micropython.viper
+def _line_viper(buf: ptr8, lb: int, w: int, h: int, x0: int, y0: int, x1: int, y1: int, color: int, t: int):
+    # Bresenham's algorithm with the pixel plot inlined
+    # Branchless abs and step: m is -1 for a negative delta, 0 otherwise
+    dx = x1 - x0
+    m = dx >> 31
+    sx = (m << 1) | 1
+    dx = (dx ^ m) - m  # abs(dx)
+    dy = y1 - y0
+    m = dy >> 31
+    sy = (m << 1) | 1
+    dy = m - (dy ^ m)  # -abs(dy)
+    err = dx + dy  # error value
+    # Each step plots a span of t pixels across the minor axis
+    if dx >= -dy:
+        tx = 0
+        ty = 1
+    else:
+        tx = 1
+        ty = 0
+    half = t >> 1
+    bits = ptr8(_BITS)
+    nbits = ptr8(_NBITS)
+    while True:
+        px = x0 - tx * half
+        py = y0 - ty * half
+        k = 0
+        while k < t:
+            # Unsigned compare also rejects negative coordinates
+            if uint(px) < uint(w) and uint(py) < uint(h):
+                idx = py * lb + (px >> 3)
+                if color:
+                    buf[idx] = buf[idx] | bits[px & 7]
+                else:
+                    buf[idx] = buf[idx] & nbits[px & 7]
+            px += tx
+            py += ty
+            k += 1
+        if x0 == x1 and y0 == y1:
+            break
+        e2 = 2 * err
+        if e2 >= dy:
+            err += dy
+            x0 += sx
+        if e2 <= dx:
+            err += dx
+            y0 += sy
+
+@micropython.viper
+def _span_fill_viper(buf: ptr8, lb: int, y: int, xs: int, xe: int, color: int):
+    # Fill pixels xs..xe (inclusive, already clipped) of row y: whole bytes
+    # in the middle, masked bytes at both ends
+    row = y * lb
+    b0 = row + (xs >> 3)
+    b1 = row + (xe >> 3)
+    ml = 0xff >> (xs & 7)
+    mr = (0xff << (7 - (xe & 7))) & 0xff
+    if b0 == b1:
+        ml = ml & mr
+        mr = ml
+    if color:
+        buf[b0] = buf[b0] | ml
+        i = b0 + 1
+        while i < b1:
+            buf[i] = 0xff
+            i += 1
+        buf[b1] = buf[b1] | mr
+    else:
+        buf[b0] = buf[b0] & (0xff ^ ml)
+        i = b0 + 1
+        while i < b1:
+            buf[i] = 0
+            i += 1
+        buf[b1] = buf[b1] & (0xff ^ mr)
+
 class FrameBuffer:
+    # Glyph outlines from the characters module, loaded on first draw_text call
+    _font = None
+    # Scaled and rotated glyph outlines keyed by char, only for the
+    # (size, rotate) in _glyph_key so the cache stays bounded by the font
+    _glyph_cache = {}
+    _glyph_key = None
+
     def __init__(self, width=EPD_WIDTH, height=EPD_HEIGHT, bg=0xff):
         self.width = width
         self.height = height
         # Calculate how many bytes are needed per row (rounding up)
         self.line_bytes = (width + 7) // 8
         self.buffer_size = self.line_bytes * height
-        self.buffer = bytearray([bg] * self.buffer_size)
+        self.buffer = bytearray(self.buffer_size)
+        _clear_viper(self.buffer, self.buffer_size, bg)
 
     
+    @micropython.native
     def clear(self, color=0xff):
-        for i in range(self.buffer_size):
-            self.buffer[i] = color
+        _clear_viper(self.buffer, self.buffer_size, color)
 
     def draw_pixel(self, x, y, color):
         """
@@ -53,82 +183,104 @@ class FrameBuffer:
           - any non-zero value sets the pixel 'on'
           - 0 clears the pixel.
         """
-        if x < 0 or x >= self.width or y < 0 or y >= self.height:
-            return  # Ignore pixels out of bounds
-        
-        # Determine which byte and bit correspond to (x,y)
-        byte_index = y * self.line_bytes + (x >> 3)
-        bit = 0x80 >> (x & 7)  # highest order bit is on the left
-        
-        if color:
-            self.buffer[byte_index] |= bit
-        else:
-            self.buffer[byte_index] &= ~bit
+        _line_viper(self.buffer, self.line_bytes, self.width, self.height, x, y, x, y, color, 1)
 
-    def draw_line(self, x0, y0, x1, y1, color):
+    @micropython.native
+    def draw_line(self, x0, y0, x1, y1, color, thickness=1):
         """
         Draw a line from (x0, y0) to (x1, y1) using Bresenham's algorithm.
         The 'color' parameter follows the same convention as in draw_pixel.
+        Lines thicker than one pixel are centered on the given endpoints,
+        thicknesses below 1 draw a one pixel line.
         """
-        dx = abs(x1 - x0)
-        dy = -abs(y1 - y0)
-        sx = 1 if x0 < x1 else -1
-        sy = 1 if y0 < y1 else -1
-        err = dx + dy  # error value
-
-        # Bresenham's algorithm
-        while True:
-            self.draw_pixel(x0, y0, color)
-            if x0 == x1 and y0 == y1:
-                break
-            e2 = 2 * err
-            if e2 >= dy:
-                err += dy
-                x0 += sx
-            if e2 <= dx:
-                err += dx
-                y0 += sy
-                    
+        span = max(thickness, 1)
+        if thickness > 1:
+            # Stretch the minor-axis span so the perpendicular width is 'thickness'
+            dx = abs(x1 - x0)
+            dy = abs(y1 - y0)
+            major = max(dx, dy)
+            if major:
+                span = int(thickness * math.sqrt(dx * dx + dy * dy) / major + 0.5)
+        _line_viper(self.buffer, self.line_bytes, self.width, self.height, x0, y0, x1, y1, color, span)
+
+    @micropython.native
     def draw_polygon(self, point_list, color, fill=False):
+        # point_list is a list of [x, y] points or a flat array('h') of x, y pairs
+        coords = flatten_polygon(point_list)
+        n = len(coords)
         # makes an outline by drawing lines (end of first line is start of a second one)
-        old_point = point_list[-1]
-        for point in point_list:
-            self.draw_line(*old_point, *point, color)
-            old_point = point
-            
-            if fill:
-                # Compute the bounding box for the polygon
-                ys = [p[1] for p in point_list]
-                min_y = max(min(ys), 0)
-                max_y = min(max(ys), self.height - 1)
-
-                # For each scanline between min_y and max_y:
-                for y in range(min_y, max_y + 1):
-                    intersections = []
-                    n = len(point_list)
-                    for i in range(n):
-                        p1 = point_list[i]
-                        p2 = point_list[(i + 1) % n]
-                        # Skip horizontal edges to avoid duplicates
-                        if p1[1] == p2[1]:
-                            continue
-                        # Check if the scanline crosses the edge
-                        if (y >= min(p1[1], p2[1])) and (y < max(p1[1], p2[1])):
-                            # Linear interpolation to find intersection x-coordinate
-                            x_int = p1[0] + (y - p1[1]) * (p2[0] - p1[0]) / (p2[1] - p1[1])
-                            intersections.append(x_int)
-                    intersections.sort()
-                    # Fill between pairs of intersections
-                    for i in range(0, len(intersections), 2):
-                        if i + 1 < len(intersections):
-                            x_start = int(math.ceil(intersections[i]))
-                            x_end = int(math.floor(intersections[i + 1]))
-                            # Clip to display boundaries
-                            x_start = max(x_start, 0)
-                            x_end = min(x_end, self.width - 1)
-                            for x in range(x_start, x_end + 1):
-                                self.draw_pixel(x, y, color)
-                                
+        old_x = coords[n - 2]
+        old_y = coords[n - 1]
+        for i in range(0, n, 2):
+            x = coords[i]
+            y = coords[i + 1]
+            self.draw_line(old_x, old_y, x, y, color)
+            old_x = x
+            old_y = y
+
+        if fill:
+            # Edge table, 4 ints per non-horizontal edge:
+            # ymin, ymax, x at ymin and x step per scanline (16.16 fixed point)
+            edges = array('i')
+            max_y = 0
+            for i in range(0, n, 2):
+                x1 = coords[i]
+                y1 = coords[i + 1]
+                j = (i + 2) % n
+                x2 = coords[j]
+                y2 = coords[j + 1]
+                # Skip horizontal edges to avoid duplicates
+                if y1 == y2:
+                    continue
+                if y1 > y2:
+                    x1, y1, x2, y2 = x2, y2, x1, y1
+                edges.append(y1)
+                edges.append(y2)
+                edges.append(x1 << 16)
+                edges.append(((x2 - x1) << 16) // (y2 - y1))
+                if y2 > max_y:
+                    max_y = y2
+            if not edges:
+                return
+            order = sorted(range(0, len(edges), 4), key=lambda e: edges[e])
+            min_y = max(edges[order[0]], 0)
+            max_y = min(max_y, self.height - 1)
+
+            buf = self.buffer
+            line_bytes = self.line_bytes
+            max_x = self.width - 1
+            active = []
+            k = 0
+            for y in range(min_y, max_y + 1):
+                # Activate edges starting on (or, when clipped, above) this scanline
+                while k < len(order) and edges[order[k]] <= y:
+                    e = order[k]
+                    k += 1
+                    if edges[e + 1] > y:
+                        edges[e + 2] += (y - edges[e]) * edges[e + 3]
+                        active.append(e)
+                # Retire edges ending here, each edge covers ymin <= y < ymax
+                i = 0
+                while i < len(active):
+                    if edges[active[i] + 1] <= y:
+                        active.pop(i)
+                    else:
+                        i += 1
+                active.sort(key=lambda e: edges[e + 2])
+                # Fill between pairs of intersections
+                for i in range(0, len(active) - 1, 2):
+                    x_start = (edges[active[i] + 2] + 0xffff) >> 16  # ceil
+                    x_end = edges[active[i + 1] + 2] >> 16  # floor
+                    # Clip to display boundaries
+                    if x_start < 0:
+                        x_start = 0
+                    if x_end > max_x:
+                        x_end = max_x
+                    if x_start <= x_end:
+                        _span_fill_viper(buf, line_bytes, y, x_start, x_end, color)
+                for e in active:
+                    edges[e + 2] += edges[e + 3]
+
     def draw_text(self, x, y, text, size, color, fill=False, rotate=0):
         tx = x
         ty = y
@@ -142,15 +294,29 @@ class FrameBuffer:
             advance_dx = 7 * size
             advance_dy = 0
         
-        with open('characters.json', 'r') as file:
-            data = json.load(file)
+        if FrameBuffer._font is None:
+            from characters import FONT
+            FrameBuffer._font = FONT
+        data = FrameBuffer._font
+        cache = FrameBuffer._glyph_cache
+        # Untransformed glyphs are used straight from the font
+        transform = size != 1 or rotate != 0
+        if transform and FrameBuffer._glyph_key != (size, rotate):
+            cache.clear()
+            FrameBuffer._glyph_key = (size, rotate)
         for c in text:
             if c == " ":
                 tx += advance_dx
                 ty += advance_dy
                 continue
-            char_polygon = data[c]
-            self.draw_polygon(move_polygon(rotate_polygon(scale_polygon(char_polygon, size), rotate), tx, ty), color, fill)
+            if not transform:
+                char_polygon = flatten_polygon(data[c])
+            else:
+                char_polygon = cache.get(c)
+                if char_polygon is None:
+                    char_polygon = rotate_polygon(scale_polygon(flatten_polygon(data[c]), size), rotate)
+                    cache[c] = char_polygon
+            self.draw_polygon(move_polygon(char_polygon, tx, ty), color, fill)
             tx += advance_dx
             ty += advance_dy
 
@@ -166,19 +332,31 @@ class EPD:
         self.busy = machine.Pin(busy_pin, machine.Pin.IN)
         self.width = EPD_WIDTH
         self.height = EPD_HEIGHT
+        # Reusable one-byte buffer for commands and single data bytes
+        self._one = bytearray(1)
+        # Scratch buffers for the window/cursor address parameters
+        self._buf1 = bytearray(1)
+        self._buf2 = bytearray(2)
+        self._buf4 = bytearray(4)
+        # Last RAM window/cursor sent, None when the controller state is unknown
+        self._win = None
+        self._cursor = None
         self.cs.value(1)
 
     def delay_ms(self, ms):
         time.sleep_ms(ms)
 
-    def spi_writebyte(self, data):
-        self.spi.write(bytearray(data))
-
     def spi_writebyte2(self, data):
-        # data is expected to be an iterable of byte values
-        self.spi.write(bytearray(data))
+        # data is expected to be a buffer or an iterable of byte values;
+        # buffers are written as is, without copying
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            self.spi.write(data)
+        else:
+            self.spi.write(bytearray(data))
 
     def reset(self):
+        self._win = None
+        self._cursor = None
         self.rst.value(1)
         self.delay_ms(20)
         self.rst.value(0)
@@ -187,15 +365,33 @@ class EPD:
         self.delay_ms(20)
 
     def send_command(self, command):
+        if command == 0x24 or command == 0x26:
+            # Data after WRITE_RAM advances the RAM address counter
+            self._cursor = None
+        self._one[0] = command
         self.dc.value(0)
         self.cs.value(0)
-        self.spi_writebyte([command])
+        self.spi.write(self._one)
         self.cs.value(1)
 
     def send_data(self, data):
+        self._one[0] = data
         self.dc.value(1)
         self.cs.value(0)
-        self.spi_writebyte([data])
+        self.spi.write(self._one)
+        self.cs.value(1)
+
+    def send_cmd_data(self, cmd, data):
+        # Command and its parameters in a single chip-select transaction
+        if cmd == 0x24 or cmd == 0x26:
+            # Data after WRITE_RAM advances the RAM address counter
+            self._cursor = None
+        self._one[0] = cmd
+        self.dc.value(0)
+        self.cs.value(0)
+        self.spi.write(self._one)
+        self.dc.value(1)
+        self.spi.write(data)
         self.cs.value(1)
 
     def send_data2(self, data):
@@ -210,60 +406,60 @@ class EPD:
             self.delay_ms(10)
 
     def TurnOnDisplay(self):
-        self.send_command(0x22)  # Display Update Control
-        self.send_data(0xf7)
+        self.send_cmd_data(0x22, b'\xf7')  # Display Update Control
         self.send_command(0x20)  # Activate Display Update Sequence
         self.ReadBusy()
 
     def TurnOnDisplay_Fast(self):
-        self.send_command(0x22)
-        self.send_data(0xC7)  # fast: 0x0c, quality: 0x0f, 0xcf
+        self.send_cmd_data(0x22, b'\xc7')  # fast: 0x0c, quality: 0x0f, 0xcf
         self.send_command(0x20)
         self.ReadBusy()
 
     def TurnOnDisplayPart(self):
-        self.send_command(0x22)
-        self.send_data(0xff)
+        self.send_cmd_data(0x22, b'\xff')
         self.send_command(0x20)
         self.ReadBusy()
 
     def SetWindow(self, x_start, y_start, x_end, y_end):
-        self.send_command(0x44)  # SET_RAM_X_ADDRESS_START_END_POSITION
-        self.send_data((x_start >> 3) & 0xFF)
-        self.send_data((x_end >> 3) & 0xFF)
-        self.send_command(0x45)  # SET_RAM_Y_ADDRESS_START_END_POSITION
-        self.send_data(y_start & 0xFF)
-        self.send_data((y_start >> 8) & 0xFF)
-        self.send_data(y_end & 0xFF)
-        self.send_data((y_end >> 8) & 0xFF)
+        win = (x_start, y_start, x_end, y_end)
+        if win == self._win:
+            return
+        self._win = win
+        buf = self._buf2
+        buf[0] = (x_start >> 3) & 0xFF
+        buf[1] = (x_end >> 3) & 0xFF
+        self.send_cmd_data(0x44, buf)  # SET_RAM_X_ADDRESS_START_END_POSITION
+        buf = self._buf4
+        buf[0] = y_start & 0xFF
+        buf[1] = (y_start >> 8) & 0xFF
+        buf[2] = y_end & 0xFF
+        buf[3] = (y_end >> 8) & 0xFF
+        self.send_cmd_data(0x45, buf)  # SET_RAM_Y_ADDRESS_START_END_POSITION
 
     def SetCursor(self, x, y):
-        self.send_command(0x4E)  # SET_RAM_X_ADDRESS_COUNTER
-        self.send_data(x & 0xFF)
-        self.send_command(0x4F)  # SET_RAM_Y_ADDRESS_COUNTER
-        self.send_data(y & 0xFF)
-        self.send_data((y >> 8) & 0xFF)
+        cursor = (x, y)
+        if cursor == self._cursor:
+            return
+        self._cursor = cursor
+        self._buf1[0] = x & 0xFF
+        self.send_cmd_data(0x4E, self._buf1)  # SET_RAM_X_ADDRESS_COUNTER
+        buf = self._buf2
+        buf[0] = y & 0xFF
+        buf[1] = (y >> 8) & 0xFF
+        self.send_cmd_data(0x4F, buf)  # SET_RAM_Y_ADDRESS_COUNTER
 
     def init(self):
         self.reset()
         self.ReadBusy()
         self.send_command(0x12)  # SWRESET
         self.ReadBusy()
-        self.send_command(0x01)  # Driver output control
-        self.send_data(0xf9)
-        self.send_data(0x00)
-        self.send_data(0x00)
-        self.send_command(0x11)  # Data entry mode
-        self.send_data(0x03)
+        self.send_cmd_data(0x01, b'\xf9\x00\x00')  # Driver output control
+        self.send_cmd_data(0x11, b'\x03')  # Data entry mode
         self.SetWindow(0, 0, self.width - 1, self.height - 1)
         self.SetCursor(0, 0)
-        self.send_command(0x3c)
-        self.send_data(0x05)
-        self.send_command(0x21)  # Display update control
-        self.send_data(0x00)
-        self.send_data(0x80)
-        self.send_command(0x18)
-        self.send_data(0x80)
+        self.send_cmd_data(0x3c, b'\x05')
+        self.send_cmd_data(0x21, b'\x00\x80')  # Display update control
+        self.send_cmd_data(0x18, b'\x80')
         self.ReadBusy()
         return 0
 
@@ -272,21 +468,15 @@ class EPD:
         self.ReadBusy()
         self.send_command(0x12)  # SWRESET
         self.ReadBusy()
-        self.send_command(0x18)  # Read built-in temperature sensor
-        self.send_data(0x80)
-        self.send_command(0x11)  # Data entry mode
-        self.send_data(0x03)
+        self.send_cmd_data(0x18, b'\x80')  # Read built-in temperature sensor
+        self.send_cmd_data(0x11, b'\x03')  # Data entry mode
         self.SetWindow(0, 0, self.width - 1, self.height - 1)
         self.SetCursor(0, 0)
-        self.send_command(0x22)  # Load temperature value
-        self.send_data(0xB1)
+        self.send_cmd_data(0x22, b'\xb1')  # Load temperature value
         self.send_command(0x20)
         self.ReadBusy()
-        self.send_command(0x1A)  # Write to temperature register
-        self.send_data(0x64)
-        self.send_data(0x00)
-        self.send_command(0x22)  # Load temperature value
-        self.send_data(0x91)
+        self.send_cmd_data(0x1A, b'\x64\x00')  # Write to temperature register
+        self.send_cmd_data(0x22, b'\x91')  # Load temperature value
         self.send_command(0x20)
         self.ReadBusy()
         return 0
@@ -303,17 +493,14 @@ class EPD:
         self.TurnOnDisplay_Fast()
         
     def init_part(self):
+        self._win = None
+        self._cursor = None
         self.rst.value(0)
         self.delay_ms(1)
         self.rst.value(1)
-        self.send_command(0x3C)  # Border Waveform
-        self.send_data(0x80)
-        self.send_command(0x01)  # Driver output control
-        self.send_data(0xF9)
-        self.send_data(0x00)
-        self.send_data(0x00)
-        self.send_command(0x11)  # Data entry mode
-        self.send_data(0x03)
+        self.send_cmd_data(0x3C, b'\x80')  # Border Waveform
+        self.send_cmd_data(0x01, b'\xf9\x00\x00')  # Driver output control
+        self.send_cmd_data(0x11, b'\x03')  # Data entry mode
         self.SetWindow(0, 0, self.width - 1, self.height - 1)
         self.SetCursor(0, 0)
 
@@ -333,30 +520,21 @@ class EPD:
         self.TurnOnDisplay()
 
     def Clear(self, color=0xFF):
+        # The frame buffer now holds the solid frame, send it as is
         self.fbuf.clear(color)
-        # Calculate line width (in bytes)
-        if self.width % 8 == 0:
-            linewidth = self.width // 8
-        else:
-            linewidth = (self.width // 8) + 1
         self.send_command(0x24)
-        self.send_data2([color] * (self.height * linewidth))
+        self.send_data2(self.fbuf.buffer)
         self.TurnOnDisplay()
         
     def ClearPart(self, color=0xFF):
+        # The frame buffer now holds the solid frame, send it as is
         self.fbuf.clear(color)
-        # Calculate line width (in bytes)
-        if self.width % 8 == 0:
-            linewidth = self.width // 8
-        else:
-            linewidth = (self.width // 8) + 1
         self.send_command(0x24)
-        self.send_data2([color] * (self.height * linewidth))
+        self.send_data2(self.fbuf.buffer)
         self.TurnOnDisplayPart()
 
     def sleep(self):
-        self.send_command(0x10)  # Enter deep sleep
-        self.send_data(0x01)
+        self.send_cmd_data(0x10, b'\x01')  # Enter deep sleep
         self.delay_ms(200)
         # Optionally deinitialize SPI or set pins to a low-power state
         self.rst.value(0)
@@ -0,0 +1,34 @@
+# Generated from characters.json by gen_font.py, do not edit
+from array import array
+
+# Glyph outlines as flat x, y coordinate pairs
+FONT = {
+    'a': array('h', [0, 0, 4, 0, 5, 1, 5, 6, 4, 7, 1, 7, 0, 6, 0, 3, 1, 2, 4, 2, 4, 3, 1, 3, 1, 6, 4, 6, 4, 1, 3, 1, 0, 1]),
+    'b': array('h', [0, 0, 1, 0, 1, 2, 1, 3, 4, 3, 4, 6, 1, 6, 1, 2, 4, 2, 5, 3, 5, 6, 4, 7, 1, 7, 0, 6]),
+    'c': array('h', [0, 1, 1, 0, 5, 0, 5, 1, 2, 1, 1, 2, 1, 5, 2, 6, 5, 6, 5, 7, 1, 7, 0, 6]),
+    'd': array('h', [5, 0, 4, 0, 4, 2, 4, 3, 1, 3, 1, 6, 4, 6, 4, 2, 1, 2, 0, 3, 0, 6, 1, 7, 4, 7, 5, 6]),
+    'e': array('h', [5, 7, 1, 7, 0, 6, 0, 1, 1, 0, 4, 0, 5, 1, 5, 3, 4, 4, 1, 4, 1, 3, 4, 3, 4, 1, 1, 1, 1, 6, 2, 6, 5, 6]),
+    'f': array('h', [2, 1, 3, 0, 5, 0, 5, 1, 3, 1, 2, 2, 2, 3, 5, 3, 5, 4, 2, 4, 2, 7, 1, 7, 1, 4, 0, 4, 0, 3, 1, 3, 1, 2]),
+    'g': array('h', [0, 1, 1, 0, 4, 0, 4, 1, 1, 1, 1, 3, 4, 3, 4, 0, 5, 1, 5, 6, 4, 7, 1, 7, 0, 6, 4, 6, 4, 4, 1, 4, 0, 3]),
+    'h': array('h', [0, 0, 1, 0, 1, 3, 4, 3, 5, 4, 5, 7, 4, 7, 4, 5, 3, 4, 1, 4, 1, 7, 0, 7]),
+    'i': array('h', [0, 2, 3, 2, 3, 0, 2, 0, 2, 1, 3, 1, 3, 2, 3, 5, 4, 6, 5, 6, 5, 7, 3, 7, 2, 6, 2, 3, 0, 3]),
+    'j': array('h', [2, 2, 5, 2, 5, 0, 4, 0, 4, 1, 5, 1, 5, 2, 5, 6, 4, 7, 1, 7, 0, 6, 0, 5, 1, 6, 3, 6, 4, 5, 4, 3, 2, 3]),
+    'k': array('h', [0, 0, 1, 0, 1, 3, 5, 1, 5, 2, 1, 4, 5, 7, 5, 6, 1, 3, 1, 7, 0, 7]),
+    'l': array('h', [0, 0, 2, 0, 2, 5, 3, 6, 5, 6, 5, 7, 2, 7, 1, 6, 1, 1, 0, 1]),
+    'm': array('h', [0, 0, 4, 0, 5, 1, 5, 7, 4, 7, 4, 3, 3, 2, 3, 6, 2, 6, 2, 2, 1, 3, 1, 7, 0, 7]),
+    'n': array('h', [0, 0, 1, 1, 1, 0, 4, 0, 5, 1, 5, 7, 4, 7, 4, 2, 3, 1, 2, 1, 1, 2, 1, 7, 0, 7]),
+    'o': array('h', [0, 1, 1, 0, 4, 0, 5, 1, 5, 6, 4, 7, 1, 7, 0, 6, 4, 6, 4, 1, 1, 1, 1, 6, 0, 6]),
+    'p': array('h', [0, 0, 1, 0, 1, 1, 4, 1, 4, 3, 1, 3, 1, 0, 4, 0, 5, 1, 5, 3, 4, 4, 1, 4, 1, 7, 0, 7]),
+    'q': array('h', [0, 1, 1, 0, 4, 0, 5, 1, 5, 7, 4, 6, 1, 6, 0, 5, 4, 5, 4, 1, 1, 1, 1, 5, 0, 5]),
+    'r': array('h', [0, 0, 1, 0, 1, 1, 2, 0, 5, 0, 5, 1, 2, 1, 1, 2, 1, 7, 0, 7]),
+    's': array('h', [0, 1, 1, 0, 5, 0, 5, 1, 2, 1, 1, 2, 2, 3, 4, 3, 5, 4, 5, 6, 4, 7, 0, 7, 0, 6, 3, 6, 4, 5, 3, 4, 1, 4, 0, 3]),
+    't': array('h', [0, 2, 2, 2, 2, 0, 3, 0, 3, 2, 5, 2, 5, 3, 3, 3, 3, 5, 4, 6, 5, 6, 5, 7, 3, 7, 2, 6, 2, 3, 0, 3]),
+    'u': array('h', [0, 0, 1, 0, 1, 4, 2, 6, 3, 6, 4, 4, 4, 0, 5, 0, 5, 6, 4, 7, 1, 7, 0, 6]),
+    'v': array('h', [0, 0, 1, 0, 3, 6, 4, 0, 5, 0, 4, 7, 2, 7]),
+    'w': array('h', [0, 0, 1, 0, 1, 6, 2, 0, 3, 0, 4, 6, 4, 0, 5, 0, 5, 7, 4, 7, 3, 4, 2, 4, 1, 7, 0, 7]),
+    'x': array('h', [3, 3, 0, 0, 0, 2, 3, 4, 5, 7, 5, 5, 3, 3, 5, 0, 5, 2, 3, 4, 0, 7, 0, 5]),
+    'y': array('h', [0, 0, 1, 0, 2, 3, 4, 0, 5, 0, 1, 7, 0, 6, 1, 5, 1, 3]),
+    'z': array('h', [0, 0, 5, 0, 5, 1, 1, 6, 5, 6, 5, 7, 0, 7, 0, 6, 4, 1, 0, 1]),
+    '-': array('h', [0, 4, 5, 4, 5, 3, 0, 3]),
+    '_': array('h', [0, 6, 5, 6, 5, 7, 0, 7]),
+}
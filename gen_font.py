@@ -0,0 +1,18 @@
+# Converts characters.json into characters.py, a font module that can be
+# frozen into the firmware (or precompiled with mpy-cross) so the driver
+# does not parse JSON on the device.
+# Run with CPython after editing characters.json: python gen_font.py
+import json
+
+with open('characters.json', 'r') as file:
+    data = json.load(file)
+
+with open('characters.py', 'w') as out:
+    out.write("# Generated from characters.json by gen_font.py, do not edit\n")
+    out.write("from array import array\n\n")
+    out.write("# Glyph outlines as flat x, y coordinate pairs\n")
+    out.write("FONT = {\n")
+    for c, polygon in data.items():
+        coords = ", ".join(str(v) for point in polygon for v in point)
+        out.write("    %r: array('h', [%s]),\n" % (c, coords))
+    out.write("}\n")